@@ -1,15 +1,54 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Callable
+from functools import lru_cache
+from selenium.webdriver.common.by import By
+from typing import Any, Callable, List, NamedTuple
 
 
 class LocatorNotDefinedError(Exception): pass
 
 
-@dataclass(frozen=True)
-class Locator:
+# HTML attributes (or properties) which come pre-packaged in LOCATE, keyed by their name on LOCATE.
+_HTML_ATTRIBUTES = {
+    'ELEMENT': 'element', # For if the element itself needs to be located.
+    'ACTION': 'action',
+    'CLASS': 'class',
+    'CONTENT': 'content',
+    'CONTROLS': 'controls',
+    'HREF': 'href',
+    'ID': 'id',
+    'LANG': 'lang',
+    'NAME': 'name',
+    'MEDIA': 'media',
+    'PROPERTY': 'property',
+    'REL': 'rel',
+    'ROLE': 'role',
+    'SRC': 'src',
+    'STYLE': 'style',
+    'TEXT': 'textContent',
+    'TITLE': 'title',
+    'TYPE': 'type',
+}
+
+
+# Selenium By constants, keyed by their attribute name on By (e.g. 'CSS_SELECTOR').
+_BY_MAP = {
+    name: getattr(By, name)
+    for name in (
+        'CLASS_NAME',
+        'CSS_SELECTOR',
+        'ID',
+        'LINK_TEXT',
+        'NAME',
+        'PARTIAL_LINK_TEXT',
+        'TAG_NAME',
+        'XPATH',
+    )
+}
+
+
+class Locator(NamedTuple):
     '''
-    Dataclass for locator strategies to make code more readable.
+    Immutable NamedTuple for locator strategies to make code more readable. Tuple-backed, so Locators are compact and fast to unpack.
 
     ### Properties
     `html_attribute: str`
@@ -44,10 +83,9 @@ class Locator:
     #     )
 
 
-@dataclass
 class _LOCATE:
     '''
-    Singleton Dataclass for quick Locator construction. Object instantiation not required, use the LOCATE constant instead.
+    Singleton class for quick Locator construction. Object instantiation not required, use the LOCATE constant instead.
 
     ### Usage
     To construct a Locator, define the desired HTML attribute, By strategy, and Value according to the following example.
@@ -56,135 +94,51 @@ class _LOCATE:
 
     This returns a Locator object which can (in this case) be used to fetch the `textContent` attribute of the element found via its CSS selector, using the value `h2.title-text`. Use in conjunction with `create_scraping_method` in `scraper.py` to define each field.
     
-    Several common attributes and strategies come pre-packaged in the LOCATE Singleton. If the desired attribute is not implemented, use the corresponding function (lower snake case) to define them:
+    Several common attributes and strategies come pre-packaged in the LOCATE Singleton (see `_HTML_ATTRIBUTES` and `_BY_MAP`). If the desired attribute is not implemented, use the corresponding function (lower snake case) to define them:
 
     `LOCATE.html_attribute('data-field').BY.ID('table021')`
 
     While there is functionality to also define custom By strategies, it is not recommended as these will not be supported by Selenium's `find_element` function.
     '''
 
-    __html_attribute: str = None
-    __by: str = None
+    __slots__ = ()
 
     # MAGIC METHODS
-    def __repr__(self) -> str:
-        if self.__html_attribute is None:
-            raise LocatorNotDefinedError('HTML attribute not defined.')
-
-        elif self.__by is None:
-            raise LocatorNotDefinedError(f'BY strategy not defined.')
+    def __getattr__(self, name: str) -> _HTML_ATTRIBUTE:
+        try:
+            return _html_attribute(_HTML_ATTRIBUTES[name])
 
-        else:
-            raise LocatorNotDefinedError(f'{self.__by} not defined.')
+        except KeyError:
+            raise AttributeError(f'LOCATE has no pre-packaged HTML attribute "{name}". Use LOCATE.html_attribute() to define it.') from None
 
 
-    # DECORATORS
-    def __sets_html_attribute(html_attribute_name: str=None):
+    def __dir__(self) -> List[str]:
+        return [*super().__dir__(), *_HTML_ATTRIBUTES]
 
-        def decorator(func: Callable):
 
-            def wrapper(self) -> _HTML_ATTRIBUTE:
-                return _HTML_ATTRIBUTE(
-                    func.__name__.lower() if html_attribute_name is None
-                    else html_attribute_name)
-
-            return wrapper
-        
-        return decorator
+    def __repr__(self) -> str:
+        return 'LOCATE'
 
 
     # INSTANCE METHODS
     def html_attribute(self, html_attribute_name: str) -> _HTML_ATTRIBUTE:
-        return _HTML_ATTRIBUTE(html_attribute_name)
-
+        return _html_attribute(html_attribute_name)
 
-    # ELEMENT PROPERTY (for if the element itself needs to be located)
-    @property
-    @__sets_html_attribute()
-    def ELEMENT(): ...
 
-
-    # PROPERTIES (HTML ATTRIBUTES)
-    @property
-    @__sets_html_attribute()
-    def ACTION(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def CLASS(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def CONTENT(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def CONTROLS(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def HREF(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def ID(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def LANG(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def NAME(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def MEDIA(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def PROPERTY(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def REL(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def ROLE(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def SRC(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def STYLE(): ...
-
-    @property
-    @__sets_html_attribute('textContent')
-    def TEXT(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def TITLE(): ...
-    
-    @property
-    @__sets_html_attribute()
-    def TYPE(): ...
-
-
-@dataclass
 class _HTML_ATTRIBUTE:
     '''
-    First intermediate Dataclass to ease readability of LOCATE Singleton.
+    First intermediate class to ease readability of LOCATE Singleton. Instances are shared between Locators with the same HTML attribute, see `_html_attribute`.
     '''
 
-    name: str
+    __slots__ = ('name',)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
 
     # MAGIC METHODS
     def __repr__(self) -> str:
-        raise LocatorNotDefinedError('Locator must be given a By strategy.')
+        return f'<Locator for "{self.name}" without a By strategy>'
 
 
     # INSTANCE METHODS
@@ -197,14 +151,21 @@ class _HTML_ATTRIBUTE:
     def BY(self): return _BY(self.name)
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _html_attribute(name: str) -> _HTML_ATTRIBUTE:
+    return _HTML_ATTRIBUTE(name)
+
+
 class _BY:
     '''
-    Second intermediate Dataclass to ease readability of LOCATE Singleton. Contains implementation for all By strategies currently supported by Selenium's `find_element` function.
+    Second intermediate class to ease readability of LOCATE Singleton. Supports all By strategies currently supported by Selenium's `find_element` function (see `_BY_MAP`).
     '''
 
-    __html_attribute: str
-    __by: str = None
+    __slots__ = ('__html_attribute', '__by')
+
+    def __init__(self, html_attribute: str, by: str=None) -> None:
+        self.__html_attribute = html_attribute
+        self.__by = by
     
     # MAGIC METHODS
     def __call__(self, value: str, default_if_not_found: Any=None, convert_to_type: Callable[[str], Any]=None) -> Locator:
@@ -212,67 +173,43 @@ class _BY:
             raise LocatorNotDefinedError('Locator must be given a By strategy.')
 
         else:
+            # Resolve to the Selenium By constant once, so the strategy is never re-normalised when scraping.
+            by = _BY_MAP.get(self.__by.replace(' ', '_').upper(), self.__by)
+
             return Locator(
                 self.__html_attribute,
-                self.__by,
+                by,
                 value,
                 default_if_not_found,
                 convert_to_type
             )
 
 
-    def __repr__(self) -> str:
-        raise LocatorNotDefinedError('Locator must be given a By strategy.')
+    def __getattr__(self, name: str) -> _BY:
+        try:
+            self.__by = _BY_MAP[name]
 
-
-    # DECORATORS
-    def __sets_by(func: Callable):
+        except KeyError:
+            raise AttributeError(f'"{name}" is not a By strategy supported by Selenium. Use .by() to define custom strategies.') from None
         
-        def wrapper(self) -> _BY:
-            self.__by = func.__name__.replace('_', ' ').lower()
-            return self
-
-        return wrapper
-    
-
-    # INSTANCE METHODS
-    def by(self, by: str) -> _BY:
-        self.__by = by
         return self
 
 
-    # PROPERTIES (BY STRATEGIES)
-    @property
-    @__sets_by
-    def CLASS_NAME(): ...
-
-    @property
-    @__sets_by
-    def CSS_SELECTOR(): ...
-
-    @property
-    @__sets_by
-    def ID(): ...
-
-    @property
-    @__sets_by
-    def LINK_TEXT(): ...
+    def __dir__(self) -> List[str]:
+        return [*super().__dir__(), *_BY_MAP]
 
-    @property
-    @__sets_by
-    def NAME(): ...
 
-    @property
-    @__sets_by
-    def PARTIAL_LINK_TEXT(): ...
+    def __repr__(self) -> str:
+        if self.__by is None:
+            return f'<Locator for "{self.__html_attribute}" without a By strategy>'
 
-    @property
-    @__sets_by
-    def TAG_NAME(): ...
+        return f'<Locator for "{self.__html_attribute}" by {self.__by} without a value>'
+    
 
-    @property
-    @__sets_by
-    def XPATH(): ...
+    # INSTANCE METHODS
+    def by(self, by: str) -> _BY:
+        self.__by = by
+        return self
 
 
 LOCATE = _LOCATE()
\ No newline at end of file
@@ -1,18 +1,333 @@
 from __future__ import annotations
+from boto3.s3.transfer import TransferConfig
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
+from itertools import islice
 from locator import Locator, LOCATE, LocatorNotDefinedError
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver import Chrome
+from lxml import etree, html
+from lxml.cssselect import CSSSelector, SelectorError
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.webdriver import Chrome, Remote
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.remote.webelement import WebElement
-from typing import Any, Callable, Dict, List, Tuple
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
 from uuid import uuid4
 from webdriver_manager.chrome import ChromeDriverManager
+import asyncio
 import boto3
+import httpx
+import logging
 import json
+import multiprocessing
 import os
-import time
-import urllib
+import re
+import requests
+import shutil
+import threading
+import urllib.parse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _json_bytes(obj: Any, newline: bool=False) -> bytes:
+    '''
+    Serialises an object to compact UTF-8 JSON, optionally ending in a newline. Uses orjson where it is installed, otherwise the standard library json module.
+    '''
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE if newline else None)
+
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode() + (b'\n' if newline else b'')
+
+
+# Chrome switches for features which are never needed while scraping.
+_CHROME_PERFORMANCE_ARGUMENTS = (
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-logging',
+)
+
+
+# Number of threads (and pooled connections per host) used by Scraper.download_images.
+_IMAGE_DOWNLOAD_WORKERS = 16
+
+
+# Path to the ChromeDriver binary, once resolved by _driver_path (or handed down to a worker process by _init_worker).
+_DRIVER_PATH = None
+
+
+def _driver_path() -> str:
+    '''
+    Installs ChromeDriver (if needed) and returns the path to its binary. Resolved once per process.
+    '''
+    global _DRIVER_PATH
+
+    if _DRIVER_PATH is None:
+        os.environ.setdefault('WDM_LOG_LEVEL', '0') # Silence webdriver_manager's logging and browser version probe output, unless set by the user.
+
+        _DRIVER_PATH = ChromeDriverManager().install()
+    
+    return _DRIVER_PATH
+
+
+@lru_cache(maxsize=1)
+def _s3_client():
+    '''
+    Creates the S3 client used for uploads. Created once per process, as loading the service model and credentials is slow.
+    '''
+    return boto3.client('s3')
+
+
+# Upload dumps larger than 8 MiB as multipart uploads, sending up to 10 parts at once.
+_S3_TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=10)
+
+
+# One step of a simple XPath ('//div', '/a', ...) with its predicates, and a single predicate within it.
+_XPATH_STEP = re.compile(r'(//?)([A-Za-z][\w-]*|\*)((?:\[[^\[\]]*\])*)')
+_XPATH_PREDICATE = re.compile(r'''\[\s*(?:
+    @(?P<attribute>[A-Za-z][\w-]*)(?:\s*=\s*(?P<quote>['"])(?P<value>.*?)(?P=quote))?
+    | (?P<function>contains|starts-with)\(\s*@(?P<function_attribute>[A-Za-z][\w-]*)\s*,\s*(?P<function_quote>['"])(?P<function_value>.*?)(?P=function_quote)\s*\)
+)\s*\]''', re.VERBOSE)
+
+_CSS_ATTRIBUTE_OPERATORS = {None: '=', 'contains': '*=', 'starts-with': '^='}
+
+
+def _xpath_to_css(xpath: str) -> str | None:
+    '''
+    Converts a simple XPath into an equivalent CSS selector, which browsers match considerably faster.
+
+    Only XPaths starting with '//' and made of element names (or '*') are converted, joined by '/' or '//' and filtered by attribute predicates: `[@name]`, `[@name="value"]`, `[contains(@name, "value")]` and `[starts-with(@name, "value")]`.
+
+    ### Returns
+    `str | None` : Equivalent CSS selector, or None if the XPath has none.
+    '''
+    if not xpath.startswith('//'):
+        return None
+    
+    selector = []
+    position = 0
+
+    while position < len(xpath):
+        step = _XPATH_STEP.match(xpath, position)
+
+        if step is None:
+            return None
+        
+        separator, tag, predicates = step.groups()
+
+        if position:
+            selector.append(' > ' if separator == '/' else ' ')
+        
+        selector.append(tag)
+        predicate_position = 0
+
+        while predicate_position < len(predicates):
+            predicate = _XPATH_PREDICATE.match(predicates, predicate_position)
+
+            if predicate is None:
+                return None
+            
+            attribute = predicate['attribute'] or predicate['function_attribute']
+            value = predicate['value'] if predicate['attribute'] else predicate['function_value']
+
+            if predicate['function'] and not value:
+                pass # contains/starts-with an empty string is true even without the attribute, so it filters nothing.
+            
+            elif value is None:
+                selector.append(f'[{attribute}]')
+            
+            elif '\n' in value:
+                return None
+            
+            else:
+                value = value.replace('\\', '\\\\').replace('"', '\\"')
+                selector.append(f'[{attribute}{_CSS_ATTRIBUTE_OPERATORS[predicate["function"]]}"{value}"]')
+            
+            predicate_position = predicate.end()
+        
+        position = step.end()
+    
+    return ''.join(selector)
+
+
+def _prefer_css(by: str, value: str) -> Tuple[str, str]:
+    '''
+    Returns the locator (by, value), with the XPath replaced by an equivalent CSS selector where one exists.
+    '''
+    css = _xpath_to_css(value) if by == By.XPATH else None
+
+    return (by, value) if css is None else (By.CSS_SELECTOR, css)
+
+
+@lru_cache(maxsize=32)
+def _trim_pattern(extensions: Tuple[str, ...]) -> re.Pattern:
+    '''
+    Compiles the pattern used by Scraper.trim_url to remove the given extensions, once per set of extensions.
+
+    Matches '/extension' followed by '/', so that adjacent extensions are all removed in a single pass.
+    '''
+    return re.compile('/(?:' + '|'.join(map(re.escape, extensions)) + ')(?=/)')
+
+
+# First number in a piece of text, for ScrapingMethod.to_columns (e.g. '1,299.99' in 'Price: £1,299.99 each').
+_NUMBER = re.compile(r'[-+]?\d[\d,]*(?:\.\d+)?')
+
+
+def _parse_number(row_data: Any, number_type: Callable[[str], Any]) -> Any:
+    '''
+    Converts the first number found in the given text to `number_type` (int or float), ignoring thousands separators. Values which are already numbers are converted too, and `int` only accepts whole numbers either way.
+    '''
+    if isinstance(row_data, (int, float)):
+        if number_type is int and not float(row_data).is_integer():
+            raise ValueError(f'{row_data!r} is not a whole number.')
+        
+        return number_type(row_data)
+    
+    match = _NUMBER.search(row_data)
+
+    if match is None:
+        raise ValueError(f'No number found in {row_data!r}.')
+    
+    return number_type(match[0].replace(',', ''))
+
+
+# Fetches several fields from the current page in a single WebDriver call.
+# Takes a locator set key and an array of [by, value, html_attribute], and returns [element_found, value] for each.
+# The first call on a page compiles each distinct locator into a finder (XPaths are parsed once with createExpression) and
+# registers the set on window under its key; later calls on the same page reuse it. Navigation clears the registry.
+_JS_BATCH_GET_ATTRIBUTES = '''
+const [key, specs] = arguments;
+const registry = window.__scraperLocators = window.__scraperLocators || {};
+
+const compile = (by, value) => {
+    switch (by) {
+        case 'css selector': return () => document.querySelector(value);
+        case 'xpath': {
+            const expression = document.createExpression(value);
+            return () => expression.evaluate(document, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        case 'id': return () => document.getElementById(value);
+        case 'class name': return () => document.getElementsByClassName(value)[0];
+        case 'tag name': return () => document.getElementsByTagName(value)[0];
+        case 'name': return () => document.getElementsByName(value)[0];
+        case 'link text': return () => [...document.getElementsByTagName('a')].find(a => a.innerText.trim() === value);
+        case 'partial link text': return () => [...document.getElementsByTagName('a')].find(a => a.innerText.includes(value));
+        default: return () => null;
+    }
+};
+
+// Same lookup order as WebElement.get_attribute: property first, then attribute.
+const getAttribute = (element, name) => {
+    let result = element[name];
+    if (result == null || typeof result === 'object' || typeof result === 'function') {
+        result = element.getAttribute ? element.getAttribute(name) : null;
+    }
+    if (typeof result === 'boolean') result = result ? 'true' : null;
+    return result == null ? null : String(result);
+};
+
+// Locators sharing the same [by, value] (e.g. several attributes of one element) share a single finder.
+const compileSet = () => {
+    const indices = new Map();
+    const finders = [];
+    const fields = specs.map(([by, value, name]) => {
+        const id = `${by}\n${value}`;
+        if (!indices.has(id)) {
+            indices.set(id, finders.length);
+            finders.push(compile(by, value));
+        }
+        return [indices.get(id), name];
+    });
+    return [finders, fields];
+};
+
+const [finders, fields] = registry[key] = registry[key] || compileSet();
+const elements = finders.map(find => find());
+
+return fields.map(([i, name]) => {
+    const element = elements[i];
+    return element ? [true, getAttribute(element, name)] : [false, null];
+});
+'''
+
+# Scrolls to the bottom of the page, waiting [pause] ms after each scroll, until neither the page height nor the number
+# of elements matching [selector] (if given) grows, or [max_scrolls] is reached. Calls back with the number of scrolls.
+_JS_SCROLL_UNTIL_LOADED = '''
+const [selector, pause, maxScrolls, done] = arguments;
+const count = () => selector ? document.querySelectorAll(selector).length : 0;
+
+(async () => {
+    let height = document.body.scrollHeight;
+    let items = count();
+    let scrolls = 0;
+
+    while (scrolls < maxScrolls) {
+        window.scrollTo(0, document.body.scrollHeight);
+        scrolls++;
+        await new Promise(resolve => setTimeout(resolve, pause));
+
+        const newHeight = document.body.scrollHeight;
+        const newItems = count();
+        if (newHeight === height && newItems === items) break;
+
+        height = newHeight;
+        items = newItems;
+    }
+
+    done(scrolls);
+})();
+'''
+
+# Finds every element matching [by, value] and returns its href (up to an optional limit) in a single WebDriver call.
+_JS_GET_HREFS = '''
+const [by, value, limit] = arguments;
+
+const findAll = (by, value) => {
+    switch (by) {
+        case 'css selector': return [...document.querySelectorAll(value)];
+        case 'xpath': {
+            const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+        }
+        case 'id': return [...document.querySelectorAll(`[id="${CSS.escape(value)}"]`)];
+        case 'class name': return [...document.getElementsByClassName(value)];
+        case 'tag name': return [...document.getElementsByTagName(value)];
+        case 'name': return [...document.getElementsByName(value)];
+        case 'link text': return [...document.getElementsByTagName('a')].filter(a => a.innerText.trim() === value);
+        case 'partial link text': return [...document.getElementsByTagName('a')].filter(a => a.innerText.includes(value));
+        default: return [];
+    }
+};
+
+const elements = findAll(by, value);
+
+return (limit == null ? elements : elements.slice(0, limit))
+    .map(element => typeof element.href === 'string' ? element.href : element.getAttribute('href'));
+'''
 
 
 class ScrapingMethod:
@@ -20,17 +335,44 @@ class ScrapingMethod:
     Object class for holding scraping strategies for later execution, and storing the results.
 
     ### Properties
-    `__find_element: Callable`
-        `find_element` function of the Scraper object passed on initalisation.
+    `__batch_get: Callable`
+        `batch_get_attributes` function of the Scraper object passed on initalisation.
     
     `__get: Callable`
         `get` function of the Scraper object passed on initalisation.
     
+    `__wait_for: Callable`
+        `wait_for` function of the Scraper object passed on initalisation.
+    
+    `__root: str`
+        Root URL of the Scraper object passed on initialisation. Used to start worker Scrapers.
+    
+    `__config: Dict`
+        Browser configuration of the Scraper object passed on initialisation. Used to start worker Scrapers.
+    
     `__locators: Dict`
         Dictionary of data column names with their associated Locators.
 
-    `__data: Dict`
-        Contains scraped data and associated UUIDs.
+    `__columns: Tuple[str, ...]`
+        Names of the data columns, in locator order.
+
+    `__rows: List[Tuple]`
+        Scraped data, one tuple of column values per page. Transposed into columns by the `data` property.
+    
+    `__uuids: List[str]`
+        UUID of each row in `__rows`.
+    
+    `__specs: Tuple`
+        Tuple of (by, value, html_attribute) for each locator, in column order. Simple XPaths are converted to CSS selectors.
+    
+    `__defaults: Tuple`
+        Value to use if not found for each locator, in column order.
+    
+    `__converters: Tuple`
+        Tuple of (column index, convert_to_type) for each locator with a type to convert to.
+    
+    `__rows_dumped: int`
+        Number of rows already written by appending dumps.
     '''
     
     def __init__(self,
@@ -47,27 +389,60 @@ class ScrapingMethod:
             Dictionary of data column names with their associated Locators.
         '''
 
-        print('\nPreparing ScrapeData object...')
+        logger.debug('Preparing ScrapingMethod object...')
 
-        self.__find_element = scraper.find_element
+        self.__batch_get = scraper.batch_get_attributes
         self.__get = scraper.get
+        self.__wait_for = scraper.wait_for
+        self.__root = scraper.root
+        self.__config = scraper.config
         self.__locators = locators
-            
 
-        # Initialise data dict using keys from locator dictionary
-        self.__data = { column_name: [] for column_name in self.__locators.keys() if column_name != 'uuid' }
-        
-        self.__data['uuid'] = []
+        # Rows are buffered as tuples while scraping, and only split into columns when the data is read or dumped.
+        self.__columns = tuple(self.__locators.keys())
+        self.__rows = []
+        self.__uuids = []
+
+        # Unpack locators once, rather than per field per page. Simple XPaths are swapped for equivalent, faster CSS selectors.
+        self.__specs = tuple((*_prefer_css(locator.by, locator.value), locator.html_attribute) for locator in self.__locators.values())
+        self.__defaults = tuple(locator.default_if_not_found for locator in self.__locators.values())
+
+        # Only columns with a type to convert to are visited after a row is scraped.
+        self.__converters = tuple(
+            (i, locator.convert_to_type) for i, locator in enumerate(self.__locators.values())
+            if locator.convert_to_type is not None
+        )
+
+        self.__rows_dumped = 0
+    
+
+    # PROPERTIES
+    @property
+    def data(self) -> Dict[str, List]:
+        '''
+        SQL-ready dictionary of the scraped data, with one list per column and a list of the associated UUIDs.
+        '''
+        columns = zip(*self.__rows) if self.__rows else ((),) * len(self.__columns)
+
+        data = { column_name: list(column) for column_name, column in zip(self.__columns, columns) }
+        data['uuid'] = list(self.__uuids)
+
+        return data
     
 
+    # INSTANCE METHODS
     def from_pages(self,
             urls: List[str],
             dump_json: bool=True,
             s3_bucket_name: str=None,
-            sleep_time: int=2) -> Dict:
+            timeout: float=10,
+            workers: int=1,
+            fast_mode: bool=False) -> Dict:
         '''
         Fetches data at each given URL.
 
+        Duplicate URLs are scraped once, and rows come back grouped by host: pages on the same host stay in the order given, but hosts are sorted by name.
+
         ### Parameters
         `urls: List[str]`
             List of URLs to scrape.
@@ -75,61 +450,174 @@ class ScrapingMethod:
         `dump_json: bool`
             If set to False, do not automatically dump data after scraping. (Default: True)
         
+        `timeout: float`
+            Max time to wait (in seconds) after loading each page for the element of the first locator to be present. Fields are scraped as soon as it appears. (Default: 10)
+        
+        `workers: int`
+            Number of headless browsers to scrape with. Pages are shared between the workers, each of which runs its own Scraper with the same root URL and configuration. Workers are separate processes, or threads holding one remote session each when the Scraper uses a Selenium Grid. (Default: 1)
+        
+        `fast_mode: bool`
+            If set to True, fetch the raw HTML of every page concurrently over HTTP and parse it with lxml, instead of rendering each page in the browser. Pages whose HTML is missing any of the scraped fields are then loaded in the browser (using `workers` as above), in case JavaScript renders them. (Default: False)
+        
         ### Returns
         `Dict[str, str]` : SQL-ready dictionary containing scraped data.
         '''
 
-        print('\nScraping...')
+        urls = list(dict.fromkeys(urls)) # Prevent re-scraping the same page.
+        urls.sort(key=lambda url: urllib.parse.urlsplit(url).netloc) # Group same-host pages so connections are reused; the sort is stable within each host.
 
-        urls = list(set(urls)) # Prevent re-scraping the same page.
+        logger.info('Scraping %d pages...', len(urls))
+        specs = self.__specs
 
-        for url in urls:
-            print()
+        if fast_mode and _can_fetch_statically(specs):
+            logger.info('Fetching pages over HTTP...')
+            results = _run_coroutine(_fetch_static_pages(urls, specs))
 
-            self.__get(url)
-            time.sleep(sleep_time)
-            
-            print('Creating UUID4...')
-            uuid = uuid4().urn
-            self.__data['uuid'].append(uuid)
+            # Pages missing a field in their raw HTML probably render it with JavaScript, so load those in the browser instead.
+            fallback = [i for i, values in enumerate(results) if None in values]
 
-            for column_name, locator in self.__locators.items():
-                by, value, html_attribute, convert_to_type = locator.by, locator.value, locator.html_attribute, locator.convert_to_type
-                row_data = None
+            if fallback:
+                logger.info('Rendering %d pages missing fields in the browser...', len(fallback))
 
-                try:
-                    print(f'Scraping field \'{column_name}\'...')
-                    row_data = self.__find_element(by, value).get_attribute(html_attribute)
+                for i, values in zip(fallback, self.__scrape_in_browser([urls[i] for i in fallback], specs, timeout, workers)):
+                    results[i] = values
+        
+        else:
+            results = self.__scrape_in_browser(urls, specs, timeout, workers)
 
-                except NoSuchElementException:
-                    print(f'ERROR: Could not find element with {by} \'{value}\'.')
-                
-                if row_data is None:
-                    print(f'ERROR: Element does not have attribute or property with name "{html_attribute}".')
-                    row_data = locator.default_if_not_found
-                
-                elif convert_to_type is not None:
-                    try:
-                        row_data = convert_to_type(row_data)
-                    except:
-                        print(f'Failed to convert row data to type "{convert_to_type}".')
+        uuids = [uuid4().urn for _ in urls]
+        first_row = len(self.__rows)
 
-                print(f'Appending data...')
+        # Bind lookups used per field once, outside the loop.
+        defaults = self.__defaults
+        converters = self.__converters
+        append_row = self.__rows.append
 
-                self.__data[column_name].append(row_data)
+        try:
+            for values in results:
+                row = [default_if_not_found if row_data is None else row_data for default_if_not_found, row_data in zip(defaults, values)]
+
+                # Defaults are stored as given; only values found on the page are converted.
+                for i, convert_to_type in converters:
+                    if values[i] is not None:
+                        try:
+                            row[i] = convert_to_type(row[i])
+                        except Exception:
+                            logger.warning('Failed to convert row data to type "%s".', convert_to_type)
+                
+                append_row(tuple(row))
+        
+        finally:
+            # Only keep UUIDs for the rows actually scraped, so they stay aligned if scraping is interrupted.
+            self.__uuids.extend(uuids[:len(self.__rows) - first_row])
         
-        print(f'\nScraping complete.')
+        logger.info('Scraping complete.')
 
         if dump_json:
             self.dump(s3_bucket_name=s3_bucket_name)
 
-        return self.__data
+        return self.data
+    
+
+    def __scrape_in_browser(self, urls: List[str], specs: Tuple, timeout: float, workers: int) -> Iterable[List]:
+        '''
+        Loads the pages in the browser, using as many Grid sessions or worker processes as `workers` asks for (no more than there are pages), yielding the raw field values in the same order as `urls`.
+        '''
+
+        workers = min(workers, len(urls))
+
+        if workers > 1 and self.__config['grid_url'] is not None:
+            logger.info('Starting %d Grid sessions...', workers)
+            return self.__scrape_pages_on_grid(urls, specs, timeout, workers)
+
+        elif workers > 1:
+            logger.info('Starting %d workers...', workers)
+            return self.__scrape_pages_in_pool(urls, specs, timeout, workers)
+        
+        else:
+            return self.__scrape_pages(urls, specs, timeout)
+    
+
+    def __scrape_pages_in_pool(self, urls: List[str], specs: Tuple, timeout: float, workers: int) -> List[List]:
+        '''
+        Loads the pages concurrently in a pool of worker processes, which each run their own headless Scraper.
+
+        ### Returns
+        `List[List]` : Raw field values for each URL, in the same order as `urls`.
+        '''
+
+        # Resolve once here and hand the path to the workers, so they never repeat the lookup (even when spawned rather than forked).
+        initargs = (self.__root, self.__config, _driver_path())
+        results = [None] * len(urls)
+
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+            try:
+                # Hand out one page at a time, so a slow page never holds up a batch of others queued behind it.
+                for i, values in pool.imap_unordered(_scrape_page, [(i, url, specs, timeout) for i, url in enumerate(urls)]):
+                    results[i] = values
+            
+            finally:
+                # Let the workers exit normally even if scraping fails, so each one quits its browser. Exiting the
+                # with block alone would terminate them before their cleanup runs.
+                pool.close()
+                pool.join()
+        
+        return results
+    
+
+    def __scrape_pages(self, urls: List[str], specs: Tuple, timeout: float) -> Iterator[List]:
+        '''
+        Loads each page in turn using the Scraper object passed on initialisation, yielding the raw field values.
+        '''
+
+        for url in urls:
+            self.__get(url)
+            self.__wait_for(*specs[0][:2], timeout)
+
+            yield self.__batch_get(specs)
+    
+
+    def __scrape_pages_on_grid(self, urls: List[str], specs: Tuple, timeout: float, workers: int) -> List[List]:
+        '''
+        Loads the pages concurrently on a Selenium Grid, using a pool of threads which each hold their own remote session. Remote sessions run on the Grid's nodes, so threads are enough to drive them in parallel.
+
+        ### Returns
+        `List[List]` : Raw field values for each URL, in the same order as `urls`.
+        '''
+
+        local = threading.local()
+        scrapers = []
+
+        def scrape_page(url: str) -> List:
+            if not hasattr(local, 'scraper'):
+                local.scraper = Scraper(self.__root, headless=True, **self.__config)
+                scrapers.append(local.scraper)
+            
+            try:
+                local.scraper.get(url)
+                local.scraper.wait_for(*specs[0][:2], timeout)
+
+                return local.scraper.batch_get_attributes(specs)
+            
+            # Report a failed page as missing fields, rather than losing every page the other sessions scraped.
+            except WebDriverException as e:
+                logger.warning('Could not scrape %s: %s', url, e.msg)
+                return [None] * len(specs)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(scrape_page, urls))
+        
+        finally:
+            for scraper in scrapers:
+                scraper.quit()
     
 
     def dump(self,
             dir: str='./raw_data/',
             filename: str='data.json',
-            s3_bucket_name: str=None) -> None:
+            s3_bucket_name: str=None,
+            append: bool=False) -> None:
         '''
         Creates a new directory (if one doesn't exist), and performs a JSON dump of currently stored data.
 
@@ -139,34 +627,153 @@ class ScrapingMethod:
         
         `filename: str`
             Name of the file in which to dump data. (Default: 'data.json')
+        
+        `append: bool`
+            If set to True, append the rows scraped since the last appending dump to the file, one JSON object per line (NDJSON), instead of overwriting it with all stored data. (Default: False)
         '''
 
-        print(f'Creating directory at {dir}')
+        logger.debug('Creating directory at %s', dir)
 
         os.makedirs(dir, exist_ok=True)
         filepath = os.path.join(dir, filename)
-        print(filepath)
         
-        print('\nPerforming JSON dump...')
+        logger.info('Performing JSON dump to %s...', filepath)
 
         try:
-            with open(filepath, 'w') as file:
-                json.dump(self.__data, file)
+            if append:
+                columns = self.__columns
+                rows = islice(zip(self.__rows, self.__uuids), self.__rows_dumped, None)
+
+                with open(filepath, 'ab') as file:
+                    for row, uuid in rows:
+                        file.write(_json_bytes(dict(zip(columns, row), uuid=uuid), newline=True))
+                
+                self.__rows_dumped = len(self.__rows)
+            
+            else:
+                # Stream one column at a time, so only a single column is ever held as JSON in memory.
+                with open(filepath, 'wb', buffering=1 << 20) as file:
+                    file.write(b'{')
+
+                    for i, column_name in enumerate(self.__columns):
+                        if column_name != 'uuid':
+                            column = [row[i] for row in self.__rows]
+                            file.write(_json_bytes(column_name) + b':' + _json_bytes(column) + b',')
+                    
+                    file.write(b'"uuid":' + _json_bytes(self.__uuids) + b'}\n')
 
             if s3_bucket_name is not None:
-                print('Creating s3 client...')
-                s3_client = boto3.client('s3')
+                self.__upload(filepath, s3_bucket_name, filename)
+
+            logger.info('Dump complete.')
+        
+        except Exception as e:
+            logger.error('Could not perform dump: %s', e)
+    
+
+    def dump_parquet(self,
+            dir: str='./raw_data/',
+            filename: str='data.parquet',
+            s3_bucket_name: str=None) -> None:
+        '''
+        Creates a new directory (if one doesn't exist), and writes currently stored data to a Parquet file. Requires pyarrow.
+
+        Parquet stores each column as a typed, compressed binary array, so files are much smaller and faster to load than JSON dumps.
+
+        ### Parameters
+        `dir: str`
+            Path for the directory where data will be written. (Default: './raw_data/')
+        
+        `filename: str`
+            Name of the file in which to write data. (Default: 'data.parquet')
+        '''
+
+        logger.debug('Creating directory at %s', dir)
+
+        os.makedirs(dir, exist_ok=True)
+        filepath = os.path.join(dir, filename)
+        
+        logger.info('Performing Parquet dump to %s...', filepath)
 
-                print(f'Uploading to S3 bucket "{s3_bucket_name}" from filepath "{filepath}"...')
-                response = s3_client.upload_file(filepath, s3_bucket_name, filename)
+        try:
+            pyarrow.parquet.write_table(self.to_table(), filepath)
 
-                print('Finished uploading.')
+            if s3_bucket_name is not None:
+                self.__upload(filepath, s3_bucket_name, filename)
 
-            print('Dump complete.')
+            logger.info('Dump complete.')
         
         except Exception as e:
-            print('ERROR: Could not perform dump.')
-            print(e)
+            logger.error('Could not perform dump: %s', e)
+    
+
+    def __upload(self, filepath: str, s3_bucket_name: str, filename: str) -> None:
+        '''
+        Uploads a dumped file to the given S3 bucket under its file name.
+        '''
+        logger.info('Uploading to S3 bucket "%s" from filepath "%s"...', s3_bucket_name, filepath)
+        _s3_client().upload_file(filepath, s3_bucket_name, filename, Config=_S3_TRANSFER_CONFIG)
+
+        logger.info('Finished uploading.')
+    
+
+    def to_columns(self, schema: Dict[str, Callable[[str], Any]]) -> Dict[str, List]:
+        '''
+        Returns the scraped data with the given columns converted to other types, e.g. for inserting into typed SQL columns.
+
+        `int` and `float` convert the first number in each value, ignoring surrounding text and thousands separators, so prices such as 'Price: £1,299.99' convert directly with `float`. `int` only accepts whole numbers, so '£1,299.99' becomes None with `int`. Values which are already numbers are converted the same way, so 2.5 also becomes None with `int`, and values which cannot be converted become None.
+
+        ### Parameters
+        `schema: Dict[str, Callable[[str], Any]]`
+            Dictionary of data column names with the type (or function) to convert their values with.
+        
+        ### Returns
+        `Dict[str, List]` : SQL-ready dictionary containing the converted data.
+        '''
+
+        data = self.data
+
+        for column_name, convert_to_type in schema.items():
+            if convert_to_type in (int, float):
+                convert = partial(_parse_number, number_type=convert_to_type)
+            else:
+                convert = convert_to_type
+            
+            column = data[column_name]
+
+            for i in range(len(column)):
+                try:
+                    column[i] = convert(column[i])
+                except (TypeError, ValueError):
+                    column[i] = None
+        
+        return data
+    
+
+    def to_table(self) -> pyarrow.Table:
+        '''
+        Returns the scraped data as a pyarrow Table, with one typed column per data column and a column of the associated UUIDs. Requires pyarrow.
+
+        Columns mixing types which Arrow can't store together (e.g. floats with a default of 'N/A', or with raw strings which failed to convert) are stored as strings, with a warning naming the column.
+
+        ### Returns
+        `pyarrow.Table` : Columnar table containing scraped data.
+        '''
+
+        if pyarrow is None:
+            raise ImportError('pyarrow is required to export scraped data as a table.')
+        
+        columns = {}
+
+        for column_name, column in self.data.items():
+            try:
+                columns[column_name] = pyarrow.array(column)
+            
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                logger.warning('Column "%s" mixes value types, so it is stored as strings.', column_name)
+                columns[column_name] = pyarrow.array([None if row_data is None else str(row_data) for row_data in column], type=pyarrow.string())
+        
+        return pyarrow.table(columns)
 
 
 class Scraper:
@@ -185,7 +792,12 @@ class Scraper:
             root: str,
             headless: bool=False,
             ignore_warnings: bool=True,
-            s3_bucket_name: str=None) -> None:
+            s3_bucket_name: str=None,
+            load_images: bool=False,
+            load_css: bool=False,
+            load_fonts: bool=False,
+            page_load_strategy: str='eager',
+            grid_url: str=None) -> None:
         '''
         Initialises the Scraper object.
 
@@ -198,24 +810,90 @@ class Scraper:
         
         `ignore_warnings: bool`
             Ignores warnings that can occur on Windows when Python attempts to start a Selenium driver. (Default: False)
+        
+        `load_images: bool`
+            Tells the browser whether or not to load images. Image URLs can still be scraped when disabled. (Default: False)
+        
+        `load_css: bool`
+            Tells the browser whether or not to load stylesheets. Enable if interacting with the page depends on its layout. (Default: False)
+        
+        `load_fonts: bool`
+            Tells the browser whether or not to download web fonts. Text is still rendered with the system fonts when disabled. (Default: False)
+        
+        `page_load_strategy: str`
+            WebDriver page load strategy. 'eager' returns from page loads once the DOM is ready, without waiting for sub-resources; use 'normal' to wait for the full load event. (Default: 'eager')
+        
+        `grid_url: str`
+            URL of a Selenium Grid hub (e.g. 'http://localhost:4444/wd/hub'). If given, the browser runs as a remote session on the Grid instead of locally. Stylesheets and fonts are not blocked on remote sessions. (Default: None)
         '''
 
         options = Options()
 
         options.add_argument('--disable-dev-shm-usage')
 
+        # Turn off browser features which scraping never uses but which still cost CPU, memory or network requests.
+        for argument in _CHROME_PERFORMANCE_ARGUMENTS:
+            options.add_argument(argument)
+        
+        if hasattr(os, 'geteuid') and os.geteuid() == 0:
+            options.add_argument('--no-sandbox') # Chrome refuses to start as root (e.g. in Docker) with the sandbox enabled.
+        
+        prefs = {'profile.default_content_setting_values.notifications': 2}
+
         if ignore_warnings:
             options.add_experimental_option('excludeSwitches', ['enable-automation', 'enable-logging'])
             options.set_capability('detach', True)
         
         if headless:
-            options.add_argument('--headless')
+            options.add_argument('--headless=new') # Same browser as headed Chrome, instead of the slower legacy headless shell.
+        
+        if not load_images:
+            prefs['profile.managed_default_content_settings.images'] = 2
+            options.add_argument('--blink-settings=imagesEnabled=false')
+        
+        options.add_experimental_option('prefs', prefs)
+        
+        options.page_load_strategy = page_load_strategy
         
         # initialise driver and load root URL
-        self.__driver = Chrome(ChromeDriverManager().install(), options=options)
+        if grid_url is not None:
+            self.__driver = Remote(command_executor=grid_url, options=options)
+
+        else:
+            self.__driver = Chrome(service=Service(_driver_path()), options=options)
+
+        # Chrome has no content setting for stylesheets or fonts, so block them at the network level.
+        blocked_urls = []
+
+        if not load_css:
+            blocked_urls += ['*.css', '*.css?*']
+        
+        if not load_fonts:
+            blocked_urls += [f'*.{extension}{query}' for extension in ('woff', 'woff2', 'ttf', 'otf') for query in ('', '?*')]
+
+        if blocked_urls and grid_url is None:
+            self.__driver.execute_cdp_cmd('Network.enable', {})
+            self.__driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
 
         self.__root = root
         self.__s3_bucket_name = s3_bucket_name
+        self.__config = {
+            'ignore_warnings': ignore_warnings,
+            'load_images': load_images,
+            'load_css': load_css,
+            'load_fonts': load_fonts,
+            'page_load_strategy': page_load_strategy,
+            'grid_url': grid_url,
+        }
+        self.__locator_keys = {} # Page-side registry keys for sets of locators used with batch_get_attributes.
+
+        # Keep-alive HTTP session for image downloads, with a connection pool per host large enough for every download thread.
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_IMAGE_DOWNLOAD_WORKERS, pool_maxsize=_IMAGE_DOWNLOAD_WORKERS)
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+
+        self.__image_dir = None # Directory images are downloaded to, created on the first download.
 
         self.home()
 
@@ -223,11 +901,14 @@ class Scraper:
     # DECORATORS
     def __log_url(func: Callable) -> Callable:
 
+        @wraps(func)
         def wrapper(self: Scraper, *args, **kwargs) -> Any:
 
             result = func(self, *args, **kwargs)
 
-            print(f'[{self.__driver.current_url}]')
+            # Reading current_url is a WebDriver round trip, so only do it when the message will be logged.
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('[%s]', self.__driver.current_url)
 
             return result
             
@@ -238,6 +919,19 @@ class Scraper:
     @property
     def current_url(self) -> str:
         return self.__driver.current_url
+    
+
+    @property
+    def root(self) -> str:
+        return self.__root
+    
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        '''
+        Keyword arguments for initialising another Scraper with the same browser configuration.
+        '''
+        return dict(self.__config)
 
     
     # INSTANCE METHODS
@@ -260,26 +954,25 @@ class Scraper:
             XPath to the search button element. (Default: '//button[@aria-label="Search"]')
         '''
 
-        print('Attempting search...')
+        logger.debug('Attempting search...')
         
         try:
             search_bar = self.__driver.find_element(By.XPATH, input_xpath)
-        except:
-            print(f'Unable to find search bar with XPATH \'{input_xpath}\'. Terminating search...')
+        except NoSuchElementException:
+            logger.warning('Unable to find search bar with XPATH \'%s\'. Terminating search...', input_xpath)
             return
         
         try:
             search_button = self.__driver.find_element(By.XPATH, button_xpath)
-        except:
-            print(f'Unable to find search button with XPATH \'{button_xpath}\'. Terminating search...')
+        except NoSuchElementException:
+            logger.warning('Unable to find search button with XPATH \'%s\'. Terminating search...', button_xpath)
             return
         
         try:
             search_bar.send_keys(search_terms)
             search_button.click()
         except Exception as e:
-            print(f'Could not perform search.')
-            print(e)
+            logger.warning('Could not perform search: %s', e)
             return
     
 
@@ -329,8 +1022,40 @@ class Scraper:
     def quit(self) -> None:
         '''
         Quits the driver and closes every associated window.
+
+        Any Chrome processes started by a local driver which are still running after it quits are then killed, so long runs don't accumulate stray browsers. Requires psutil.
         '''
+        browser_processes = self.__browser_processes()
+
         self.__driver.quit()
+        self.__session.close()
+
+        if browser_processes:
+            _, alive = psutil.wait_procs(browser_processes, timeout=3)
+
+            for process in alive:
+                try:
+                    process.kill()
+                except psutil.NoSuchProcess:
+                    pass
+            
+            if alive:
+                logger.warning('Killed %d browser processes left running after quitting.', len(alive))
+    
+
+    def __browser_processes(self) -> List:
+        '''
+        Returns every process spawned by the local ChromeDriver, or an empty list for remote sessions or if psutil isn't installed.
+        '''
+        service = getattr(self.__driver, 'service', None) # Remote sessions have no local service.
+
+        if psutil is None or service is None or service.process is None:
+            return []
+        
+        try:
+            return psutil.Process(service.process.pid).children(recursive=True)
+        except psutil.NoSuchProcess:
+            return []
     
 
     def find_element(self, by: str | Locator, value: str) -> WebElement:
@@ -381,7 +1106,104 @@ class Scraper:
         result = self.__driver.find_elements(by, value)
 
         if not result:
-            print(f'Could not find element using {by} "{value}".')
+            logger.warning('Could not find element using %s "%s".', by, value)
+        
+        return result
+    
+
+    def wait_for(self, by: str | Locator, value: str=None, timeout: float=10) -> bool:
+        '''
+        Waits until an element is present on the current page.
+
+        ### Parameters
+        `by: str | Locator`
+            Strategy for locating elements.
+        
+        `value: str`
+            Value by which to search according to the locator strategy.
+        
+        `timeout: float`
+            Max time to wait, in seconds. (Default: 10)
+        
+        ### Returns
+        `bool` : True if the element was found before timing out.
+        '''
+
+        if isinstance(by, str):
+            if value is None:
+                raise LocatorNotDefinedError(f'{by} not defined.')
+            
+        elif isinstance(by, Locator):
+            _locator = by
+            by = _locator.by
+            value = _locator.value
+        
+        try:
+            WebDriverWait(self.__driver, timeout).until(expected_conditions.presence_of_element_located((by, value)))
+            return True
+        
+        except TimeoutException:
+            logger.warning('Timed out after %ss waiting for element with %s \'%s\'.', timeout, by, value)
+            return False
+    
+
+    def batch_get_attributes(self, specs: Tuple[Tuple[str, str, str], ...]) -> List:
+        '''
+        Finds several elements on the current page and gets an attribute (or property) of each, in a single WebDriver call.
+
+        ### Parameters
+        `specs: Tuple[Tuple[str, str, str], ...]`
+            Tuple of (by, value, html_attribute) for each element.
+        
+        ### Returns
+        `List` : Value of each attribute, or None where the element or attribute could not be found.
+        '''
+
+        values = []
+
+        key = self.__locator_keys.setdefault(specs, len(self.__locator_keys))
+        results = self.__driver.execute_script(_JS_BATCH_GET_ATTRIBUTES, key, specs)
+
+        for (by, value, html_attribute), (found, row_data) in zip(specs, results):
+            if not found:
+                logger.warning('Could not find element with %s \'%s\'.', by, value)
+            
+            elif row_data is None:
+                logger.warning('Element does not have attribute or property with name "%s".', html_attribute)
+            
+            values.append(row_data)
+        
+        return values
+    
+
+    def get_hrefs(self, by: str | Locator, value: str=None, limit: int=None) -> List[str]:
+        '''
+        Finds elements given a By strategy and locator, and gets the href property of each, in a single WebDriver call.
+
+        ### Parameters
+        `by: str | Locator`
+            Strategy for locating elements.
+        
+        `value: str`
+            Value by which to search according to the locator strategy.
+        
+        `limit: int`
+            Max number of hrefs to get. If None, get the href of every element found. (Default: None)
+        '''
+
+        if isinstance(by, str):
+            if value is None:
+                raise LocatorNotDefinedError(f'{by} not defined.')
+            
+        elif isinstance(by, Locator):
+            _locator = by
+            by = _locator.by
+            value = _locator.value
+        
+        result = self.__driver.execute_script(_JS_GET_HREFS, by, value, limit)
+
+        if not result:
+            logger.warning('Could not find element using %s "%s".', by, value)
         
         return result
 
@@ -427,14 +1249,48 @@ class Scraper:
         `height: int`
             Height to scroll to (in pixels). 0 is the top of the document.
         '''
-        self.__driver.execute_script(f'window.scrollTo({height});')
+        self.__driver.execute_script('window.scrollTo(0, arguments[0]);', height)
+    
+
+    def scroll_until_loaded(self, selector: str=None, pause: float=0.3, max_scrolls: int=50) -> int:
+        '''
+        Keeps scrolling to the bottom of the current page until no more content loads, e.g. on infinite-scrolling pages. Runs in a single WebDriver call.
+
+        ### Parameters
+        `selector: str`
+            CSS selector for the elements being loaded. If given, scrolling also continues while more of them appear, even if the page height doesn't change. (Default: None)
+        
+        `pause: float`
+            Time to wait (in seconds) after each scroll for new content to load. (Default: 0.3)
+        
+        `max_scrolls: int`
+            Max number of times to scroll. (Default: 50)
+        
+        ### Returns
+        `int` : Number of times the page was scrolled.
+        '''
+        # Allow the whole loop to run within one call, raising the session's script timeout for this call only if needed.
+        script_timeout = self.__driver.timeouts.script
+        required_timeout = max_scrolls * pause + 10
+        raise_timeout = script_timeout is not None and script_timeout < required_timeout
+
+        if raise_timeout:
+            self.__driver.set_script_timeout(required_timeout)
+        
+        try:
+            return self.__driver.execute_async_script(_JS_SCROLL_UNTIL_LOADED, selector, pause * 1000, max_scrolls)
+        
+        finally:
+            if raise_timeout:
+                self.__driver.set_script_timeout(script_timeout)
     
 
     def retrieve_urls(self,
             by: str | Locator,
             value: str=None,
             limit: int=None,
-            next_button_xpath: str=None) -> List[str]:
+            next_button_xpath: str=None,
+            timeout: float=10) -> List[str]:
         '''
         Retrieves a list of URLs from the href attribute of the given elements on the current webpage.
 
@@ -446,16 +1302,18 @@ class Scraper:
             Value by which to search according to the locator strategy.
         
         `limit: int`
-            Max number of results to fetch. If None, obtain all results possible. (Default: None)
+            Max number of results to fetch. If None, obtain all results possible. Combine with `next_button_xpath` to fetch up to the limit across multiple pages. (Default: None)
 
         `next_button_xpath: str`
             XPath to the "Next" button (if applicable) to allow searching of multiple pages. (Default: None)
         
+        `timeout: float`
+            Max time to wait (in seconds) after clicking the "Next" button for new URLs to appear. Retrieval stops if none do. (Default: 10)
+        
         ### Returns
         `List[str]` : List of URLs from the href property of each selected element.
         '''
 
-        elements = []
         response = 'Finished retrieving URLs.'
 
         if isinstance(by, str):
@@ -467,33 +1325,46 @@ class Scraper:
             by = _locator.by
             value = _locator.value
 
-        print(f'Retrieving URLs from {self.__driver.current_url}')
-        print(f'Using {by} \'{value}\'')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Retrieving URLs from %s using %s \'%s\'', self.__driver.current_url, by, value)
 
         if limit:
-            print(f'Limit: {limit}')
-            while len(elements) < limit:
-                elements.extend(self.find_elements(by, value))
-            elements = elements[:limit]
+            logger.debug('Limit: %d', limit)
+
+        urls = self.get_hrefs(by, value, limit or None)
+
+        if next_button_xpath:
+            seen = set(urls)
+
+            def new_urls(driver) -> List[str]:
+                return [url for url in dict.fromkeys(driver.execute_script(_JS_GET_HREFS, by, value, None)) if url not in seen]
 
-        elif next_button_xpath:
-            while True:
+            while not limit or len(urls) < limit:
                 try:
                     next_button = self.find_element(By.XPATH, next_button_xpath)
-                except:
-                    print(f'Could not find next_button at XPATH \'{next_button_xpath}\'')
+                except NoSuchElementException:
+                    logger.warning('Could not find next_button at XPATH \'%s\'', next_button_xpath)
                     response = 'URL retrieval interrupted. Terminating...'
                     break
 
-                elements.extend(self.find_elements(by, value))
                 next_button.click()
+
+                # Wait for the next page's elements, and stop if clicking Next doesn't bring up any URLs not already seen.
+                try:
+                    page_urls = WebDriverWait(self.__driver, timeout).until(new_urls)
+                except TimeoutException:
+                    logger.warning('No new URLs found after clicking next_button.')
+                    break
+
+                if limit:
+                    page_urls = page_urls[:limit - len(urls)]
+
+                seen.update(page_urls)
+                urls.extend(page_urls)
         
-        else:
-            elements = self.find_elements(by, value)
-        
-        print(response)
+        logger.info(response)
 
-        return list(element.get_attribute('href') for element in elements)
+        return urls
 
 
     def extend_url(self, *extensions: str) -> None:
@@ -505,56 +1376,97 @@ class Scraper:
             List of URL extensions to append.
         '''
 
-        new_url = self.__driver.current_url.removesuffix('/')
-        for extension in extensions:
-            new_url += '/' + extension
+        current_url = self.__driver.current_url
+        new_url = '/'.join((current_url.removesuffix('/'), *extensions)) if extensions else current_url
         
-        self.__driver.get(new_url)
+        if new_url != current_url: # Don't reload the page if nothing was appended.
+            self.__driver.get(new_url)
 
 
     def trim_url(self, *extensions: str) -> None:
         '''
         Removes extensions from the current URL, then gets the new URL.
 
+        Every path segment matching one of the extensions is removed, including repeated ones, e.g. `trim_url('a')` on 'https://a.com/a/a/b/' gets 'https://a.com/b/'. The last segment is only removed if the URL ends with a forward-slash.
+
         ### Parameters
         `extensions: str`
-            Strings to remove from current URL, including leading forward-slashes.
+            Path segments to remove from current URL, without forward-slashes.
         '''
 
-        new_url = self.__driver.current_url
-        for extension in extensions:
-            new_url = new_url.replace('/' + extension + '/', '/')
+        current_url = new_url = self.__driver.current_url
+
+        if extensions:
+            new_url = _trim_pattern(extensions).sub('', new_url)
         
-        self.__driver.get(new_url)
+        if new_url != current_url: # Don't reload the page if none of the extensions were in the URL.
+            self.__driver.get(new_url)
 
 
-    def download_image(self, url: str, filename: str) -> None:
+    def download_image(self, url: str, filename: str, skip_existing: bool=False) -> None:
         '''
         Download the image stored at the given url in a list, and temporarily store it under a local directory with the given filename.
 
+        The image is streamed to disk over the Scraper's HTTP session, reusing any open connection to the same host.
+
         ### Parameters
         `url: str`
             URL of image.
         
         `filename: str`
             File name to save the image under (extension included).
+        
+        `skip_existing: bool`
+            If set to True, don't download the image if a file with the same name was already saved, e.g. by a previous run. (Default: False)
         '''
-        os.makedirs('./raw_data/images/', exist_ok=True)
+        filepath = self.__prepare_image_dir() + filename
 
-        urllib.request.urlretrieve(url, os.path.join('./raw_data/images/', filename))
+        if not (skip_existing and os.path.exists(filepath)):
+            _save_image(self.__session, url, filepath)
     
 
-    def download_images(self, url_list: List[str]) -> None:
+    def download_images(self, url_list: List[str], max_workers: int=_IMAGE_DOWNLOAD_WORKERS, skip_existing: bool=False) -> None:
         '''
         Downloads the images stored at each url in a list and temporarily stores them in a local directory.
 
+        Images are downloaded concurrently over the Scraper's HTTP session, so connections to the same host are kept alive and reused between calls.
+
         ### Parameters
         `url_list: List[str]`
             List of image URLs.
+        
+        `max_workers: int`
+            Max number of images to download at once. Above 16, connections beyond the session's pool are not kept alive. (Default: 16)
+        
+        `skip_existing: bool`
+            If set to True, don't download images whose file was already saved, e.g. when resuming an interrupted run over the same list. (Default: False)
+        '''
+        image_dir = self.__prepare_image_dir()
+
+        downloads = [
+            (_url, f'{image_dir}image{_index}.{_url.rpartition(".")[-1]}')
+            for _index, _url in enumerate(url_list)
+        ]
+
+        if skip_existing:
+            downloads = [(_url, filepath) for _url, filepath in downloads if not os.path.exists(filepath)]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_save_image, self.__session, _url, filepath) for _url, filepath in downloads]
+
+            for future in futures:
+                future.result()
+    
+
+    def __prepare_image_dir(self) -> str:
+        '''
+        Returns the directory to download images to, creating it on the first call only.
         '''
-        for _index, _url in enumerate(url_list):
-            file_extension = _url.rpartition('.')[-1]
-            self.download_image(_url, f'image{_index}.{file_extension}')
+        if self.__image_dir is None:
+            os.makedirs('./raw_data/images/', exist_ok=True)
+            self.__image_dir = './raw_data/images/'
+        
+        return self.__image_dir
     
 
     def create_scraping_method(self, **locators: Locator | Tuple) -> ScrapingMethod:
@@ -592,7 +1504,8 @@ class Scraper:
         '''
         # If tuples are used, convert to Locator objects
         for id, locator_like in locators.items():
-            if isinstance(locator_like, Tuple):
+            # Locators are NamedTuples themselves, so only convert plain tuples.
+            if isinstance(locator_like, Tuple) and not isinstance(locator_like, Locator):
 
                 if len(locator_like) == 2:
                     html_attribute = 'textContent'
@@ -606,4 +1519,227 @@ class Scraper:
                     value = locator_like[2]
                     locators[id] = LOCATE.html_attribute(html_attribute).by(strategy)(value)
         
-        return ScrapingMethod(self, locators)
\ No newline at end of file
+        return ScrapingMethod(self, locators)
+
+
+# WORKER FUNCTIONS
+_worker_scraper: Scraper = None
+
+
+def _init_worker(root: str, config: Dict[str, Any], driver_path: str) -> None:
+    '''
+    Initialises a `from_pages` worker process with its own headless Scraper. WebDriver sessions are not safe to share, so each process drives its own browser.
+
+    ### Parameters
+    `root: str`
+        Root URL for the worker's Scraper.
+    
+    `config: Dict[str, Any]`
+        Browser configuration for the worker's Scraper (see `Scraper.config`).
+    
+    `driver_path: str`
+        Path to the ChromeDriver binary, as resolved by the parent process.
+    '''
+    global _DRIVER_PATH, _worker_scraper
+
+    _DRIVER_PATH = driver_path
+    _worker_scraper = Scraper(root, headless=True, **config)
+
+    # Quit the driver when the worker exits, so no browser processes are left behind.
+    multiprocessing.util.Finalize(_worker_scraper, _worker_scraper.quit, exitpriority=10)
+
+
+def _scrape_page(task: Tuple[int, str, Tuple, float]) -> Tuple[int, List]:
+    '''
+    Loads a page in the worker's Scraper and fetches its raw field values.
+
+    ### Parameters
+    `task: Tuple[int, str, Tuple, float]`
+        Index of the page, URL to scrape, field specs (by, value, html_attribute), and max time to wait for the first field's element after loading the page.
+    
+    ### Returns
+    `Tuple[int, List]` : Index of the page, and its raw field values. Every value is None if the page could not be scraped.
+    '''
+    i, url, specs, timeout = task
+
+    try:
+        _worker_scraper.get(url)
+        _worker_scraper.wait_for(*specs[0][:2], timeout)
+
+        return i, _worker_scraper.batch_get_attributes(specs)
+    
+    # Report a failed page as missing fields, rather than failing the whole pool and losing every other page.
+    except WebDriverException as e:
+        logger.warning('Could not scrape %s: %s', url, e.msg)
+        return i, [None] * len(specs)
+
+
+def _save_image(session: requests.Session, url: str, filepath: str) -> None:
+    '''
+    Streams the image at the given URL to a local file.
+
+    ### Parameters
+    `session: Session`
+        HTTP session to download with.
+    
+    `url: str`
+        URL of image.
+    
+    `filepath: str`
+        Path to save the image under (extension included).
+    '''
+    with session.get(url, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        # Copy in 1 MiB chunks, so memory use stays constant regardless of image size.
+        with open(f'{filepath}.part', 'wb') as file:
+            shutil.copyfileobj(response.raw, file, length=1 << 20)
+    
+    # Only give the file its name once complete, so an interrupted download is never mistaken for a saved image.
+    os.replace(f'{filepath}.part', filepath)
+
+
+# STATIC FETCHING
+# Compilers for the equivalents of Selenium's By strategies on a parsed lxml document.
+# Each takes a locator value and returns a finder, which takes the document and returns the matching elements.
+_XPATH_BY_ID = etree.XPath('//*[@id=$value]')
+_XPATH_BY_NAME = etree.XPath('//*[@name=$value]')
+_XPATH_BY_LINK_TEXT = etree.XPath('//a[normalize-space(.)=$value]')
+_XPATH_BY_PARTIAL_LINK_TEXT = etree.XPath('//a[contains(., $value)]')
+
+_STATIC_FINDERS: Dict[str, Callable[[str], Callable[[html.HtmlElement], List]]] = {
+    By.CSS_SELECTOR: lambda value: CSSSelector(value, translator='html'),
+    By.XPATH: lambda value: etree.XPath(value),
+    By.ID: lambda value: partial(_XPATH_BY_ID, value=value),
+    By.CLASS_NAME: lambda value: lambda tree: tree.find_class(value),
+    By.TAG_NAME: lambda value: lambda tree: list(tree.iter(value)),
+    By.NAME: lambda value: partial(_XPATH_BY_NAME, value=value),
+    By.LINK_TEXT: lambda value: partial(_XPATH_BY_LINK_TEXT, value=value),
+    By.PARTIAL_LINK_TEXT: lambda value: partial(_XPATH_BY_PARTIAL_LINK_TEXT, value=value),
+}
+
+
+@lru_cache(maxsize=None)
+def _static_finder(by: str, value: str) -> Callable[[html.HtmlElement], List]:
+    '''
+    Compiles a locator into a finder for parsed lxml documents. Cached, so each CSS selector or XPath is only parsed once.
+    '''
+    return _STATIC_FINDERS[by](value)
+
+
+def _can_fetch_statically(specs: Tuple) -> bool:
+    '''
+    Checks whether every locator can be compiled for lxml, so the pages can be scraped without a browser. Some selectors which browsers accept, such as the CSS `:has()` pseudo-class, cannot be.
+    '''
+    for by, value, _ in specs:
+        if by not in _STATIC_FINDERS:
+            return False
+        
+        try:
+            _static_finder(by, value)
+        except (SelectorError, etree.XPathSyntaxError) as e:
+            logger.warning('Cannot use fast mode, %s \'%s\' is not supported outside the browser: %s', by, value, e)
+            return False
+    
+    return True
+
+
+def _run_coroutine(coroutine) -> Any:
+    '''
+    Runs a coroutine to completion from synchronous code. `asyncio.run()` cannot be called while an event loop is already running in this thread, as in Jupyter or an async caller, so the coroutine is run on a one-off worker thread instead.
+    '''
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+async def _fetch_static_pages(urls: List[str], specs: Tuple, max_connections: int=20) -> List[List]:
+    '''
+    Concurrently fetches the raw HTML of each page and extracts the raw field values, without a browser.
+
+    ### Parameters
+    `urls: List[str]`
+        List of URLs to scrape.
+    
+    `specs: Tuple`
+        Tuple of (by, value, html_attribute) for each field.
+    
+    `max_connections: int`
+        Max number of requests in flight at once. (Default: 20)
+    
+    ### Returns
+    `List[List]` : Raw field values for each URL, in the same order as `urls`.
+    '''
+
+    limits = httpx.Limits(max_connections=max_connections)
+    timeout = httpx.Timeout(10, pool=None) # Queued requests wait for a free connection rather than timing out.
+
+    fields = tuple((_static_finder(by, value), by, value, html_attribute) for by, value, html_attribute in specs)
+
+    async with httpx.AsyncClient(http2=True, follow_redirects=True, limits=limits, timeout=timeout) as client:
+
+        async def fetch(url: str) -> List:
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+
+            except httpx.HTTPError as e:
+                logger.warning('Could not fetch %s: %s', url, e)
+                return [None] * len(specs)
+            
+            logger.info('[%s]', response.url)
+
+            try:
+                tree = html.fromstring(response.content)
+            except (etree.ParserError, ValueError) as e: # e.g. an empty body.
+                logger.warning('Could not parse %s: %s', url, e)
+                return [None] * len(specs)
+            
+            tree.make_links_absolute(str(response.url)) # Match the absolute URLs the browser gives for href/src.
+
+            return _fetch_static_fields(tree, fields)
+
+        return await asyncio.gather(*(fetch(url) for url in urls))
+
+
+def _fetch_static_fields(tree: html.HtmlElement, fields: Tuple) -> List:
+    '''
+    Fetches the raw value of each field from a parsed page. Fields which cannot be found are returned as None.
+
+    ### Parameters
+    `tree: HtmlElement`
+        Root element of the parsed page.
+    
+    `fields: Tuple`
+        Tuple of (finder, by, value, html_attribute) for each field, where finder is compiled by `_static_finder`.
+    '''
+    values = []
+    found = {} # Elements found by each finder, so fields sharing a locator only search the page once.
+
+    for find, by, value, html_attribute in fields:
+        row_data = None
+        elements = found.get(find)
+
+        if elements is None:
+            elements = found[find] = find(tree)
+
+        if not elements:
+            logger.warning('Could not find element with %s \'%s\'.', by, value)
+        
+        elif html_attribute == 'textContent':
+            row_data = elements[0].text_content()
+        
+        else:
+            row_data = elements[0].get(html_attribute)
+
+            if row_data is None:
+                logger.warning('Element does not have attribute with name "%s".', html_attribute)
+        
+        values.append(row_data)
+    
+    return values